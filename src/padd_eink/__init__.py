@@ -4,7 +4,12 @@ from .utils import (
     generate_ascii_bar,
     heatmap_generator,
     generate_qrascii,
+    build_qr_code,
     check_padd_eink_version,
+    start_version_check,
+    get_padd_summary_cached,
+    clear_padd_summary_cache,
+    PADD_SUMMARY_TTL_SECONDS,
 )
 
 __all__ = [
@@ -13,5 +18,10 @@ __all__ = [
     "generate_ascii_bar",
     "heatmap_generator",
     "generate_qrascii",
+    "build_qr_code",
     "check_padd_eink_version",
+    "start_version_check",
+    "get_padd_summary_cached",
+    "clear_padd_summary_cache",
+    "PADD_SUMMARY_TTL_SECONDS",
 ]
@@ -6,22 +6,20 @@ import logging
 import argparse
 import platform
 import importlib.metadata
+from pathlib import Path
+from dataclasses import dataclass
 
 # --- Library Imports ---
+# Heavier imports (pihole6api, richcolorlog, Textual, the e-Ink stack) are
+# deferred to main(), so --help and --version only load python-dotenv and the
+# package's lightweight utils module.
 from dotenv import load_dotenv
-from pihole6api import PiHole6Client
-from richcolorlog import setup_logging
 
-from .tui import PADD_TUI
-from .eink_display import run_eink_display
+from . import start_version_check
 
 # --- Configuration ---
-# Load environment variables from .env file in the project's root directory
-project_dir = os.path.join(os.path.dirname(__file__), "..", "..")
-load_dotenv(dotenv_path=os.path.join(project_dir, ".env"))
-
-PIHOLE_IP = os.getenv("PIHOLE_IP")
-API_TOKEN = os.getenv("API_TOKEN")
+# The .env file lives in the project's root directory; it is loaded in main()
+project_dir = Path(__file__).resolve().parents[2]
 
 # --- Logging Setup ---
 logger = None
@@ -39,8 +37,36 @@ except importlib.metadata.PackageNotFoundError:
     __version__ = "0.0.0-dev"
 
 
+@dataclass(frozen=True, slots=True)
+class PiholeConfig:
+    """Pi-hole connection settings, resolved once at startup."""
+
+    ip: str
+    token: str
+    url: str  # Admin web interface, shown as the QR code / link
+    auth: str  # API base URL used to create the client
+
+    @classmethod
+    def from_env(cls, secure=False):
+        """Builds the config from PIHOLE_IP and API_TOKEN; both must be set."""
+        protocol = "https" if secure else "http"
+        pihole_ip = os.environ["PIHOLE_IP"]
+        return cls(
+            ip=pihole_ip,
+            token=os.environ["API_TOKEN"],
+            url=f"{protocol}://{pihole_ip}/admin/",
+            auth=f"{protocol}://{pihole_ip}",
+        )
+
+
 def create_pihole_client(pihole_ip, api_token):
-    """Attempts to create and return a PiHole6Client instance."""
+    """Attempts to create and return a PiHole6Client instance.
+
+    The client owns a single pooled keep-alive requests.Session, so one instance
+    is shared by every consumer (TUI worker, e-Ink refresh thread and handlers).
+    """
+    from pihole6api import PiHole6Client
+
     logger.info(f"Connecting to Pi-hole at {pihole_ip}")
     try:
         client = PiHole6Client(pihole_ip, api_token)
@@ -92,37 +118,43 @@ def main():
     )
     args = parser.parse_args()
 
+    from richcolorlog import setup_logging
+
     logger = setup_logging(
         level=getattr(logging, args.level), logfile=args.logfile, rich_tracebacks=args.traceback
     )
 
-    if not PIHOLE_IP or not API_TOKEN:
+    # Load environment variables from the .env file only on a real run
+    load_dotenv(dotenv_path=project_dir / ".env")
+    if not os.environ.get("PIHOLE_IP") or not os.environ.get("API_TOKEN"):
         logger.critical("PIHOLE_IP and/or API_TOKEN not found in .env file.")
         sys.exit(1)
 
-    protocol = "https" if args.secure else "http"
-    pihole_url = f"{protocol}://{PIHOLE_IP}/admin/"
-    pihole_auth = f"{protocol}://{PIHOLE_IP}"
+    config = PiholeConfig.from_env(secure=args.secure)
 
-    pihole_client = create_pihole_client(pihole_auth, API_TOKEN)
+    start_version_check()
+    pihole_client = create_pihole_client(config.auth, config.token)
 
     is_arm = platform.machine() in ["armv7l", "aarch64", "armv6l"]
 
     if args.tui or not is_arm:
         if not args.tui and not is_arm:
             logger.info("Not running on a recognized ARM platform, forcing TUI mode.")
-        app = PADD_TUI(pihole_client=pihole_client, pihole_url=pihole_url, __version__=__version__)
+        from .tui import PADD_TUI
+
+        app = PADD_TUI(pihole_client=pihole_client, config=config, __version__=__version__)
         app.run()
     else:
+        from .eink_display import run_eink_display
+
         run_eink_display(
             pihole_client=pihole_client,
-            pihole_url=pihole_url,
-            pihole_auth=pihole_auth,
-            api_token=API_TOKEN,
+            config=config,
             pihole_client_creator=create_pihole_client,
             splash_duration=SPLASH_SCREEN_DURATION_SECONDS,
             rotate_interval=SCREEN_AUTO_ROTATE_INTERVAL_SECONDS,
              __version__=__version__,
+            refresh_interval=INFO_REFRESH_INTERVAL_SECONDS,
         )
 
 
@@ -1,11 +1,22 @@
-import os
 import time
+import heapq
+import queue
 import logging
+import threading
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont
-import qrcode
-
-from . import format_uptime, compare_versions, check_padd_eink_version
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from pathlib import Path
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+from . import (
+    format_uptime,
+    compare_versions,
+    check_padd_eink_version,
+    get_padd_summary_cached,
+    clear_padd_summary_cache,
+    build_qr_code,
+)
 
 # --- Constants ---
 WHITE = 255
@@ -20,27 +31,208 @@ KEY1_PIN = 5
 KEY2_PIN = 6
 KEY3_PIN = 13
 KEY4_PIN = 19
-# Debounce time for gpiozero is in seconds
-BUTTON_DEBOUNCE_S = 0.3
+# Debounce time for gpiozero is in seconds; contact bounce settles well within
+# 20 ms, and INPUT_QUIET_S already coalesces deliberate bursts of presses
+BUTTON_DEBOUNCE_S = 0.02
 BUTTON_HOLD_S = 5  # Time in seconds to hold for QR code
-
-project_dir = os.path.join(os.path.dirname(__file__), "..", "..")
+CHECKMARK = "✓"  # Unicode for checkmark
+# (label, key in the PADD "version" section) for each component, in display order
+VERSION_COMPONENTS = (("Pi-hole:", "core"), ("Web UI:", "web"), ("FTL:", "ftl"))
+# Partial refreshes leave ghosting behind; after this many the panel is
+# re-initialised and fully refreshed to erase it
+EINK_PARTIAL_ERASURE_LIMIT = 20
+# Quiet time after the last button press before redrawing, so bursts coalesce
+INPUT_QUIET_S = 0.5
+# Wake just after the minute rolls over so the header clock has changed
+CLOCK_TICK_MARGIN_S = 0.05
+# SPI clock for the panel; the driver defaults to 4 MHz, the controller's
+# write cycle allows 20 MHz
+EINK_SPI_SPEED_HZ = 20_000_000
+
+# Resolved once to an absolute path so lookups do not depend on the working directory
+project_dir = Path(__file__).resolve().parents[2]
 # --- Paths (Updated to use subdirectories) ---
-LOGO_PATH = os.path.join(project_dir, "images", "Pihole-eInk.jpg")
-HEADER_LOGO_PATH = os.path.join(project_dir, "images", "black-hole-2.png")
+LOGO_PATH = str(project_dir / "images" / "Pihole-eInk.jpg")
+HEADER_LOGO_PATH = str(project_dir / "images" / "black-hole-2.png")
 # Switched to DejaVuSans for better character support (including checkmarks)
-FONT_PATH = os.path.join(project_dir, "fonts", "DejaVuSans.ttf")
-FONT_BOLD_PATH = os.path.join(project_dir, "fonts", "DejaVuSans-Bold.ttf")
+FONT_PATH = str(project_dir / "fonts" / "DejaVuSans.ttf")
+FONT_BOLD_PATH = str(project_dir / "fonts" / "DejaVuSans-Bold.ttf")
 
 logger = logging.getLogger(__name__)
 
-# --- Globals for e-Ink Mode ---
-padd_data = {}
-last_data_refresh_time = 0
-current_screen_index = 0
-force_redraw = True
-qrcode_mode_active = False  # New state for QR code screen
-connection_failed_at_boot = False
+
+# --- State for e-Ink Mode ---
+@dataclass(slots=True)
+class EinkState:
+    """Mutable e-Ink display state shared by the main loop and button handlers."""
+
+    padd_data: dict = field(default_factory=dict)
+    last_data_refresh_time: float = 0
+    current_screen_index: int = 0
+    partial_refresh_count: int = 0
+    input_quiet_deadline: float = 0
+    padd_strings: dict = field(default_factory=dict)
+    padd_strings_source: dict | None = None
+    qrcode_mode_active: bool = False
+    connection_failed_at_boot: bool = False
+    pihole: object = None
+
+
+state = EinkState()
+
+# Latest PADD summary from the background fetch; only the newest one is kept
+_data_queue = queue.Queue(maxsize=1)
+# Set by button handlers and data fetches to wake the render loop for a redraw
+redraw_event = threading.Event()
+# Held while a PADD summary fetch is in flight so fetches never overlap
+_fetch_lock = threading.Lock()
+
+
+@lru_cache(maxsize=16)
+def _font(path, size):
+    """Loads a TrueType font once per (path, size) and reuses it across redraws."""
+    try:
+        return ImageFont.truetype(path, size)
+    except IOError:
+        logger.warning(f"Could not load font {path}, using default.")
+        return ImageFont.load_default()
+
+
+# Every font the screens use, loaded once at import time
+FONT_TITLE = _font(FONT_PATH, FONT_SIZE_HEADER_TITLE)
+FONT_DATE = _font(FONT_PATH, FONT_SIZE_HEADER_DATE)
+FONT_BODY = _font(FONT_PATH, FONT_SIZE_BODY)
+FONT_BODY_BOLD = _font(FONT_BOLD_PATH, FONT_SIZE_BODY)
+FONT_SMALL = _font(FONT_PATH, FONT_SIZE_SMALL)
+FONT_SMALL_BOLD = _font(FONT_BOLD_PATH, FONT_SIZE_SMALL)
+
+
+# Scratch canvas used only for text measurement, matching the 1-bit screen mode
+_measure_draw = ImageDraw.Draw(Image.new("1", (1, 1), WHITE))
+
+
+@lru_cache(maxsize=512)
+def _text_bbox(text, font):
+    """Returns the (cached) bounding box of text rendered in the given font."""
+    return _measure_draw.textbbox((0, 0), text, font=font)
+
+
+@lru_cache(maxsize=512)
+def _text_width(text, font):
+    """Returns the (cached) ink width of text, for right-aligning or centering it.
+
+    This is the rendered extent, not the advance width: the two differ by the
+    side bearings, which would leave right-aligned columns ragged.
+    """
+    bbox = _text_bbox(text, font)
+    return bbox[2] - bbox[0]
+
+
+@lru_cache(maxsize=16)
+def _row_layout(rows, label_font, value_font, y, right_align_x, line_height):
+    """Lays out (label, value) rows with left labels and right-aligned values.
+
+    Returns (label_ops, value_ops), each a tuple of ((x, y), text, font) draw
+    operations. Layout only depends on the formatted strings and geometry, so
+    unchanged data skips measuring.
+    """
+    label_ops = []
+    value_ops = []
+    for label, value in rows:
+        label_ops.append(((10, y), label, label_font))
+        value_width = _text_width(value, value_font)
+        value_ops.append(((right_align_x - value_width, y), value, value_font))
+        y += line_height
+    return tuple(label_ops), tuple(value_ops)
+
+
+@lru_cache(maxsize=32)
+def _text_layer(ops):
+    """Rasterizes constant ((x, y), text, font) ops once into a cropped 1-bit mask.
+
+    Returns (offset, mask), or None if nothing is inked. Blitting the mask with
+    draw.bitmap() inks exactly the pixels draw.text() would, without running
+    FreeType again on every frame.
+    """
+    right = bottom = 1
+    for (x, y), text, font in ops:
+        bbox = _text_bbox(text, font)
+        right = max(right, int(x + bbox[2]) + 2)
+        bottom = max(bottom, int(y + bbox[3]) + 2)
+    layer = Image.new("1", (right, bottom), WHITE)
+    layer_draw = ImageDraw.Draw(layer)
+    for xy, text, font in ops:
+        layer_draw.text(xy, text, font=font, fill=BLACK)
+    mask = ImageChops.invert(layer)
+    box = mask.getbbox()
+    if box is None:
+        return None
+    return box[:2], mask.crop(box)
+
+
+def _draw_text_layer(draw, ops):
+    """Draws constant text ops from their cached pre-rendered mask."""
+    layer = _text_layer(ops)
+    if layer is not None:
+        draw.bitmap(layer[0], layer[1], fill=BLACK)
+
+
+# Glyphs are rendered away from the layer origin so negative bearings are kept
+_GLYPH_ORIGIN = 4
+# Characters whose per-glyph placement matches draw.text() exactly; letters are
+# positioned slightly differently inside whole strings, so they are left to PIL
+_GLYPH_CHARS = frozenset("0123456789,.%:°C -")
+
+
+@lru_cache(maxsize=256)
+def _glyph(char, font):
+    """Returns (advance, layer) for a single character, rendered once per font."""
+    layer = _text_layer.__wrapped__((((_GLYPH_ORIGIN, _GLYPH_ORIGIN), char, font),))
+    return font.getlength(char), layer
+
+
+def _draw_value_text(draw, xy, text, font):
+    """Draws changing text by blitting cached glyph masks.
+
+    Values reuse a small alphabet (digits, separators, units), so compositing
+    pre-rendered glyphs avoids running FreeType over every new string. Text
+    outside that alphabet is drawn normally.
+    """
+    if not _GLYPH_CHARS.issuperset(text):
+        draw.text(xy, text, font=font, fill=BLACK)
+        return
+    x, y = xy
+    for char in text:
+        advance, layer = _glyph(char, font)
+        if layer is not None:
+            (dx, dy), mask = layer
+            draw.bitmap(
+                (int(x) + dx - _GLYPH_ORIGIN, int(y) + dy - _GLYPH_ORIGIN), mask, fill=BLACK
+            )
+        x += advance
+
+
+@lru_cache(maxsize=4)
+def _qr_image(url, box_size=4, border=2):
+    """Renders the shared QR code matrix for a URL as a 1-bit image, once."""
+    modules = build_qr_code(url).modules
+    size = len(modules) + 2 * border
+    qr_img = Image.new("1", (size, size), WHITE)
+    for y, row in enumerate(modules, start=border):
+        for x, dark in enumerate(row, start=border):
+            if dark:
+                qr_img.putpixel((x, y), BLACK)
+    return qr_img.resize((size * box_size, size * box_size), Image.NEAREST)
+
+
+def _load_image(path):
+    """Fully decodes an image file and releases its handle; None if it is missing."""
+    try:
+        with Image.open(path) as img:
+            img.load()
+            return img.copy()
+    except FileNotFoundError:
+        return None
 
 
 # --- e-Ink Drawing Functions ---
@@ -52,77 +244,187 @@ def draw_splash_screen(epd, logo_image, width, height):
         logo_w, logo_h = logo_image.size
         pos_x = (width - logo_w) // 2
         pos_y = (height - logo_h) // 2
-        image.paste(logo_image.convert("L"), (pos_x, pos_y))
-    epd.display_4Gray(epd.getbuffer_4Gray(image))
+        if logo_image.mode != "L":
+            logo_image = logo_image.convert("L")
+        image.paste(logo_image, (pos_x, pos_y))
+    epd.display_4Gray(_pack_frame_4gray(image))
 
 
-def draw_header(draw, width, header_logo_img):
-    try:
-        font_title = ImageFont.truetype(FONT_PATH, FONT_SIZE_HEADER_TITLE)
-        font_date = ImageFont.truetype(FONT_PATH, FONT_SIZE_HEADER_DATE)
-    except IOError:
-        font_title, font_date = ImageFont.load_default(), ImageFont.load_default()
+def prepare_header_logo(header_logo_img):
+    """Returns the 1-bit 40x40 header thumbnail, computed once at startup."""
+    if not header_logo_img:
+        return None
+    header_logo_thumb = header_logo_img.copy()
+    header_logo_thumb.thumbnail((40, 40))
+    return header_logo_thumb.convert("1")
+
+
+@lru_cache(maxsize=1)
+def _header_clock(minute):
+    """Formats the header date and time once per wall-clock minute."""
+    now = datetime.fromtimestamp(minute * 60)
+    return now.strftime("%a, %b %d"), now.strftime("%H:%M")
 
+
+@dataclass(frozen=True, slots=True)
+class HeaderLayout:
+    """The unchanging part of the header, rendered once at startup."""
+
+    mask: Image.Image  # Logo, title and divider line as a single 1-bit mask
+    text_x: int  # Left edge of the title and date
+    date_y: int
+    line_y: int  # Divider position; screens start drawing below it
+
+
+def prepare_header(width, header_logo_img):
+    """Renders the logo, title and divider into one mask for draw_header()."""
     logo_x, logo_y = 5, 5
-    title_x = logo_x
-    if header_logo_img:
-        header_logo_thumb = header_logo_img.copy()
-        header_logo_thumb.thumbnail((40, 40))
-        draw.bitmap((logo_x, logo_y), header_logo_thumb.convert("1"), fill=BLACK)
-        title_x += header_logo_thumb.width + 10
-    draw.text((title_x, logo_y), "Pi-hole Stats", font=font_title, fill=BLACK)
-    now = datetime.now()
-    date_text = now.strftime("%a, %b %d")
-    time_text = now.strftime("%H:%M")
+    text_x = logo_x
     date_y = logo_y + FONT_SIZE_HEADER_TITLE + 3
-    draw.text((title_x, date_y), date_text, font=font_date, fill=BLACK)
-    time_bbox = draw.textbbox((0, 0), time_text, font=font_date)
-    time_width = time_bbox[2] - time_bbox[0]
-    draw.text((width - time_width - 5, date_y), time_text, font=font_date, fill=BLACK)
     line_y = date_y + FONT_SIZE_HEADER_DATE + 5
-    draw.line([(0, line_y), (width, line_y)], fill=BLACK, width=1)
-    return line_y
+    mask = Image.new("1", (width + 1, line_y + 1), 0)
+    mask_draw = ImageDraw.Draw(mask)
+    if header_logo_img:
+        mask_draw.bitmap((logo_x, logo_y), header_logo_img, fill=255)
+        text_x += header_logo_img.width + 10
+    title = _text_layer((((text_x, logo_y), "Pi-hole Stats", FONT_TITLE),))
+    if title is not None:
+        mask_draw.bitmap(title[0], title[1], fill=255)
+    mask_draw.line([(0, line_y), (width, line_y)], fill=255, width=1)
+    return HeaderLayout(mask, text_x, date_y, line_y)
+
+
+def draw_header(draw, width, header):
+    font_date = FONT_DATE
+
+    draw.bitmap((0, 0), header.mask, fill=BLACK)
+    date_text, time_text = _header_clock(int(time.time() // 60))
+    _draw_value_text(draw, (header.text_x, header.date_y), date_text, font_date)
+    time_width = _text_width(time_text, font_date)
+    _draw_value_text(draw, (width - time_width - 5, header.date_y), time_text, font_date)
+    return header.line_y
 
 
 def draw_qrcode_screen(draw, width, height, url):
-    try:
-        font_regular = ImageFont.truetype(FONT_PATH, FONT_SIZE_SMALL)
-        font_bold = ImageFont.truetype(FONT_BOLD_PATH, FONT_SIZE_BODY)
-    except IOError:
-        font_regular, font_bold = ImageFont.load_default(), ImageFont.load_default()
+    font_regular = FONT_SMALL
+    font_bold = FONT_BODY_BOLD
 
     title_text = "Pi-Hole Admin"
-    title_bbox = draw.textbbox((0, 0), title_text, font=font_bold)
+    title_bbox = _text_bbox(title_text, font_bold)
     title_width, title_height = title_bbox[2], title_bbox[3]
     title_y = 3
     draw.text(((width - title_width) / 2, title_y), title_text, font=font_bold, fill=BLACK)
 
-    qr = qrcode.QRCode(version=1, box_size=4, border=2)
-    qr.add_data(url)
-    qr.make(fit=True)
-    qr_img = qr.make_image(fill_color="black", back_color="white").convert("1")
+    qr_img = _qr_image(url)
     qr_pos_x = (width - qr_img.size[0]) // 2
     qr_pos_y = title_y + title_height + 10
     draw.bitmap((qr_pos_x, qr_pos_y), qr_img, fill=BLACK)
 
     instruction_text = "Hold key 1 button to close"
-    inst_bbox = draw.textbbox((0, 0), instruction_text, font=font_regular)
-    inst_width = inst_bbox[2]
+    inst_width = _text_bbox(instruction_text, font_regular)[2]
     inst_y = qr_pos_y + qr_img.size[1] + 4
     draw.text(
         ((width - inst_width) / 2, inst_y), instruction_text, font=font_regular, fill=BLACK
     )
 
 
+def _version_status(comp_data):
+    """Returns a tuple: (display_string, has_update_bool)"""
+    if not comp_data:
+        return ("N/A", False)
+
+    local = comp_data.get("local", {}).get("version", "N/A")
+    remote = comp_data.get("remote", {}).get("version", "N/A")
+
+    update_available = False
+    if local != "N/A" and remote != "N/A":
+        if compare_versions(remote, local) > 0:
+            update_available = True
+
+    if update_available:
+        display_str = f"  {local}**"
+    else:
+        display_str = f"  {local} {CHECKMARK}" if local != "N/A" else "N/A"
+
+    return (display_str, update_available)
+
+
+def _format_padd_strings(data):
+    """Formats the stats shown on the Pi-hole, system and version screens."""
+    queries_data = data.get("queries", {})
+    blocked = queries_data.get("blocked", 0)
+    total = queries_data.get("total", 0)
+    percent = queries_data.get("percent_blocked", 0.0)
+    gravity_size = data.get("gravity_size", 0)
+
+    top_stats = {
+        "Latest:": "N/A" if (latest := data.get("recent_blocked")) is None else latest,
+        "Top Ad:": "N/A" if (ad := data.get("top_blocked")) is None else ad,
+        "Top Domain:": "N/A" if (domain := data.get("top_domain")) is None else domain,
+        "Top Client:": "N/A" if (client := data.get("top_client")) is None else client,
+        "Clients:": "N/A"
+        if (clients := data.get("active_clients")) is None
+        else f"{clients}",
+    }
+
+    version_data = data.get("version")
+    if version_data:
+        versions = tuple(
+            (name, *_version_status(version_data.get(key)))
+            for name, key in VERSION_COMPONENTS
+        )
+    else:
+        versions = None
+
+    system_data = data.get("system") or {}
+    ipv4 = (data.get("iface") or {}).get("v4") or {}
+    load_percent = ((system_data.get("cpu") or {}).get("load") or {}).get("percent") or [0.0]
+    ram = (system_data.get("memory") or {}).get("ram") or {}
+    sensors = data.get("sensors") or {}
+    stats_to_draw = {
+        "Host:": f"{data.get('node_name', 'N/A')} ({ipv4.get('addr', 'N/A')})",
+        "CPU Load:": f"{load_percent[0]:.1f}%",
+        "Memory:": f"{ram.get('%used', 0.0):.1f}%",
+        "CPU Temp:": f"{sensors.get('cpu_temp', 0.0):.1f}°C",
+        "Uptime:": format_uptime(system_data.get("uptime", 0)),
+    }
+
+    return {
+        "percent": percent,
+        "blocking": f"{int(gravity_size):,}",
+        "piholed": f" {int(blocked):,} of {int(total):,} ({percent:.1f}%)",
+        "top_stats": tuple(top_stats.items()),
+        "system": tuple(stats_to_draw.items()),
+        "versions": versions,
+    }
+
+
+def _padd_strings(data):
+    """Returns the formatted stats for data, formatting only when the data changes."""
+    if state.padd_strings_source is not data:
+        state.padd_strings = _format_padd_strings(data)
+        state.padd_strings_source = data
+    return state.padd_strings
+
+
+@lru_cache(maxsize=8)
+def _bar_mask(bar_width, bar_height, fill_width):
+    """Renders the outlined "Piholed" bar with its filled part as a 1-bit mask.
+
+    The bar only changes with the data, so redraws blit it in one call.
+    """
+    mask = Image.new("1", (bar_width + 1, bar_height + 1), 0)
+    mask_draw = ImageDraw.Draw(mask)
+    mask_draw.rectangle([0, 0, bar_width, bar_height], outline=255)
+    if fill_width > 0:
+        mask_draw.rectangle([0, 0, fill_width, bar_height], fill=255)
+    return mask
+
+
 def draw_pihole_stats_screen(draw, width, height, data, header_bottom_y,__version__):
     """Draws the main Pi-hole statistics screen."""
-    try:
-        font_small = ImageFont.truetype(FONT_PATH, FONT_SIZE_SMALL)
-        font_small_bold = ImageFont.truetype(FONT_BOLD_PATH, FONT_SIZE_SMALL)
-    except IOError:
-        logger.warning("Could not load custom small fonts, using defaults.")
-        font_small = ImageFont.load_default()
-        font_small_bold = font_small
+    font_small = FONT_SMALL
+    font_small_bold = FONT_SMALL_BOLD
 
     y = header_bottom_y + 10
     right_align_x = width - 10
@@ -132,31 +434,25 @@ def draw_pihole_stats_screen(draw, width, height, data, header_bottom_y,__versio
         draw.text((10, y), "No Pi-hole data available.", font=font_small, fill=BLACK)
         return
 
-    queries_data = data.get("queries", {})
-    blocked = queries_data.get("blocked", 0)
-    total = queries_data.get("total", 0)
-    percent = queries_data.get("percent_blocked", 0.0)
-    gravity_size = data.get("gravity_size", 0)
+    strings = _padd_strings(data)
+    percent = strings["percent"]
 
     blocking_label = "Blocking:"
-    blocking_value = f"{int(gravity_size):,}"
-    draw.text((10, y), blocking_label, font=font_small_bold, fill=BLACK)
-    value_bbox = draw.textbbox((0, 0), blocking_value, font=font_small)
-    value_width = value_bbox[2] - value_bbox[0]
-    draw.text((right_align_x - value_width, y), blocking_value, font=font_small, fill=BLACK)
+    blocking_value = strings["blocking"]
+    static_ops = [((10, y), blocking_label, font_small_bold)]
+    value_width = _text_width(blocking_value, font_small)
+    _draw_value_text(draw, (right_align_x - value_width, y), blocking_value, font_small)
     y += line_height_small
 
     piholed_label = "Piholed:"
-    draw.text((10, y), piholed_label, font=font_small_bold, fill=BLACK)
+    static_ops.append(((10, y), piholed_label, font_small_bold))
 
-    piholed_label_bbox = draw.textbbox((0, 0), piholed_label, font=font_small_bold)
-    piholed_label_width = piholed_label_bbox[2] - piholed_label_bbox[0]
+    piholed_label_width = _text_width(piholed_label, font_small_bold)
 
-    bar_text = f" {int(blocked):,} of {int(total):,} ({percent:.1f}%)"
-    draw.text((10 + piholed_label_width, y), bar_text, font=font_small, fill=BLACK)
+    bar_text = strings["piholed"]
+    _draw_value_text(draw, (10 + piholed_label_width, y), bar_text, font_small)
 
-    bar_text_bbox = draw.textbbox((0, 0), bar_text, font=font_small)
-    bar_text_width = bar_text_bbox[2] - bar_text_bbox[0]
+    bar_text_width = _text_width(bar_text, font_small)
 
     bar_height = 15
     bar_y = y - 2
@@ -166,47 +462,32 @@ def draw_pihole_stats_screen(draw, width, height, data, header_bottom_y,__versio
     bar_width = width - bar_x - 10
 
     if bar_width > 10:
-        draw.rectangle(
-            [bar_x, bar_y, bar_x + bar_width, bar_y + bar_height],
-            outline=BLACK,
-            fill=WHITE,
-        )
         fill_width = int(bar_width * (percent / 100.0))
-        if fill_width > 0:
-            draw.rectangle(
-                [bar_x, bar_y, bar_x + fill_width, bar_y + bar_height], fill=BLACK
-            )
+        draw.bitmap(
+            (bar_x, bar_y), _bar_mask(bar_width, bar_height, fill_width), fill=BLACK
+        )
     else:
         logger.warning("Not enough horizontal space for percentage bar.")
 
     y += bar_height
 
-    top_stats = {
-        "Latest:": "N/A" if (latest := data.get("recent_blocked")) is None else latest,
-        "Top Ad:": "N/A" if (ad := data.get("top_blocked")) is None else ad,
-        "Top Domain:": "N/A" if (domain := data.get("top_domain")) is None else domain,
-        "Top Client:": "N/A" if (client := data.get("top_client")) is None else client,
-        "Clients:": "N/A"
-        if (clients := data.get("active_clients")) is None
-        else f"{clients}",
-    }
-
-    for label, value in top_stats.items():
-        draw.text((10, y), label, font=font_small_bold, fill=BLACK)
-
-        value_bbox = draw.textbbox((0, 0), value, font=font_small)
-        value_width = value_bbox[2] - value_bbox[0]
-        draw.text((right_align_x - value_width, y), value, font=font_small, fill=BLACK)
-
-        y += line_height_small
+    label_ops, value_ops = _row_layout(
+        strings["top_stats"],
+        font_small_bold,
+        font_small,
+        y,
+        right_align_x,
+        line_height_small,
+    )
+    # Labels only depend on layout, so they come from one cached bitmap
+    _draw_text_layer(draw, tuple(static_ops) + label_ops)
+    for xy, text, font in value_ops:
+        _draw_value_text(draw, xy, text, font)
 
 
 def draw_system_info_screen(draw, width, height, data, header_bottom_y,__version__):
-    try:
-        font_bold = ImageFont.truetype(FONT_BOLD_PATH, FONT_SIZE_BODY)
-        font_regular = ImageFont.truetype(FONT_PATH, FONT_SIZE_BODY)
-    except IOError:
-        font_bold, font_regular = ImageFont.load_default(), ImageFont.load_default()
+    font_bold = FONT_BODY_BOLD
+    font_regular = FONT_BODY
     y = header_bottom_y + 10
     line_height = FONT_SIZE_BODY + 7
     right_align_x = width - 10
@@ -214,39 +495,24 @@ def draw_system_info_screen(draw, width, height, data, header_bottom_y,__version
         draw.text((10, y), "No system data available.", font=font_regular, fill=BLACK)
         return
 
-    system_data = data.get("system", {})
-    stats_to_draw = {
-        "Host:": f"{data.get('node_name', 'N/A')} ({data.get('iface', {}).get('v4', {}).get('addr', 'N/A')})",
-        "CPU Load:": f"{system_data.get('cpu', {}).get('load', {}).get('percent', [0.0])[0]:.1f}%",
-        "Memory:": f"{system_data.get('memory', {}).get('ram', {}).get('%used', 0.0):.1f}%",
-        "CPU Temp:": f"{data.get('sensors', {}).get('cpu_temp', 0.0):.1f}°C",
-        "Uptime:": format_uptime(system_data.get("uptime", 0)),
-    }
-    for label, value in stats_to_draw.items():
-        draw.text((10, y), label, font=font_bold, fill=BLACK)
-        value_bbox = draw.textbbox((0, 0), value, font=font_regular)
-        draw.text(
-            (right_align_x - value_bbox[2], y), value, font=font_regular, fill=BLACK
-        )
-        y += line_height
+    label_ops, value_ops = _row_layout(
+        _padd_strings(data)["system"], font_bold, font_regular, y, right_align_x, line_height
+    )
+    _draw_text_layer(draw, label_ops)
+    for xy, text, font in value_ops:
+        _draw_value_text(draw, xy, text, font)
 
 
 def draw_version_screen(draw, width, height, data, header_bottom_y, __version__):
     """Draws the component versions screen, indicating available updates."""
-    try:
-        font_body = ImageFont.truetype(FONT_PATH, FONT_SIZE_BODY)
-        font_body_bold = ImageFont.truetype(FONT_BOLD_PATH, FONT_SIZE_BODY)
-        font_small_bold = ImageFont.truetype(FONT_BOLD_PATH, FONT_SIZE_SMALL)
-    except IOError:
-        logger.warning("Could not load custom fonts for version screen, using defaults.")
-        font_body = ImageFont.load_default()
-        font_body_bold = font_body
-        font_small_bold = ImageFont.load_default()
+    font_body = FONT_BODY
+    font_body_bold = FONT_BODY_BOLD
+    font_small_bold = FONT_SMALL_BOLD
 
     y = header_bottom_y + 10
     line_height = FONT_SIZE_BODY + 10
     any_updates = False
-    checkmark = "✓"  # Unicode for checkmark
+    checkmark = CHECKMARK
     right_align_x = width - 10
 
     # PADD-eInk version
@@ -260,53 +526,25 @@ def draw_version_screen(draw, width, height, data, header_bottom_y, __version__)
     padd_eink_version_str = parts[1].strip() if len(parts) > 1 else ''
 
     draw.text((10, y), padd_eink_label, font=font_body_bold, fill=BLACK)
-    version_bbox = draw.textbbox((0, 0), padd_eink_version_str, font=font_body)
-    version_width = version_bbox[2] - version_bbox[0] + 3
+    version_width = _text_width(padd_eink_version_str, font_body) + 3
     draw.text(
         (right_align_x - version_width, y), padd_eink_version_str, font=font_body, fill=BLACK
     )
     y += line_height
 
-    version_data = data.get("version")
-    if not version_data:
+    versions = _padd_strings(data)["versions"] if data else None
+    if not versions:
         draw.text((10, y), "Version data not available.", font=font_body, fill=BLACK)
         return
 
-    def get_version_status(comp_data):
-        """Returns a tuple: (display_string, has_update_bool)"""
-        if not comp_data:
-            return ("N/A", False)
-
-        local = comp_data.get("local", {}).get("version", "N/A")
-        remote = comp_data.get("remote", {}).get("version", "N/A")
-
-        update_available = False
-        if local != "N/A" and remote != "N/A":
-            if compare_versions(remote, local) > 0:
-                update_available = True
-
-        if update_available:
-            display_str = f"  {local}**"
-        else:
-            display_str = f"  {local} {checkmark}" if local != "N/A" else "N/A"
-
-        return (display_str, update_available)
-
-    component_names = {
-        "Pi-hole:": version_data.get("core"),
-        "Web UI:": version_data.get("web"),
-        "FTL:": version_data.get("ftl"),
-    }
-
-    for name, comp_data in component_names.items():
-        version_str, has_update = get_version_status(comp_data)
+    label_ops = []
+    for name, version_str, has_update in versions:
         if has_update:
             any_updates = True
 
-        draw.text((10, y), name, font=font_body_bold, fill=BLACK)
+        label_ops.append(((10, y), name, font_body_bold))
 
-        version_bbox = draw.textbbox((0, 0), version_str, font=font_body)
-        version_width = version_bbox[2] - version_bbox[0]
+        version_width = _text_width(version_str, font_body)
         draw.text(
             (right_align_x - version_width, y), version_str, font=font_body, fill=BLACK
         )
@@ -319,113 +557,356 @@ def draw_version_screen(draw, width, height, data, header_bottom_y, __version__)
     else:
         status_text = f"{checkmark} {checkmark} SYSTEM IS HEALTHY {checkmark} {checkmark}"
 
-    text_bbox = draw.textbbox((0, 0), status_text, font=font_small_bold)
-    text_width = text_bbox[2] - text_bbox[0]
-    draw.text(
-        ((width - text_width) / 2, y), status_text, font=font_small_bold, fill=BLACK
-    )
+    text_width = _text_width(status_text, font_small_bold)
+    label_ops.append((((width - text_width) / 2, y), status_text, font_small_bold))
+    _draw_text_layer(draw, tuple(label_ops))
 
 
 def draw_connection_failed_screen(draw, width, height, header_bottom_y, pihole_ip):
     """Draws the screen indicating a failure to connect to Pi-hole."""
-    try:
-        font_bold = ImageFont.truetype(FONT_BOLD_PATH, FONT_SIZE_BODY)
-        font_regular = ImageFont.truetype(FONT_PATH, FONT_SIZE_SMALL)
-    except IOError:
-        font_bold, font_regular = ImageFont.load_default(), ImageFont.load_default()
+    font_bold = FONT_BODY_BOLD
+    font_regular = FONT_SMALL
 
     y = header_bottom_y + 20
     line_height = FONT_SIZE_BODY + 5
 
     line1_text = "UNABLE TO CONNECT"
-    line1_bbox = draw.textbbox((0, 0), line1_text, font=font_bold)
-    line1_width = line1_bbox[2] - line1_bbox[0]
+    line1_width = _text_width(line1_text, font_bold)
     draw.text(((width - line1_width) / 2, y), line1_text, font=font_bold, fill=BLACK)
     y += line_height
 
     line2_text = f"to {pihole_ip}"
-    line2_bbox = draw.textbbox((0, 0), line2_text, font=font_bold)
-    line2_width = line2_bbox[2] - line2_bbox[0]
+    line2_width = _text_width(line2_text, font_bold)
     draw.text(((width - line2_width) / 2, y), line2_text, font=font_bold, fill=BLACK)
     y += line_height + 10
 
     line3_text = "Is PiHole OK?"
-    line3_bbox = draw.textbbox((0, 0), line3_text, font=font_regular)
-    line3_width = line3_bbox[2] - line3_bbox[0]
+    line3_width = _text_width(line3_text, font_regular)
     draw.text(((width - line3_width) / 2, y), line3_text, font=font_regular, fill=BLACK)
 
 
+# --- e-Ink Panel Updates ---
+def _dirty_box(image, prev_image):
+    """Returns the bounding box of pixels that differ between two frames, or None."""
+    return ImageChops.logical_xor(image, prev_image).getbbox()
+
+
+def _panel_window(box, canvas_width):
+    """Maps a landscape canvas box onto the panel's portrait partial-refresh window.
+
+    The driver rotates the landscape canvas so canvas x becomes panel y (reversed)
+    and canvas y becomes panel x, which must be byte-aligned.
+    """
+    x0, y0, x1, y1 = box
+    return (y0 // 8 * 8, canvas_width - x1, -(-y1 // 8) * 8, canvas_width - x0)
+
+
+def _pack_frame(image):
+    """Packs a landscape 1-bit frame into the panel's portrait 1-bpp buffer.
+
+    Byte-for-byte the same as epd.getbuffer() for a landscape image, but the
+    rotation and bit packing run in PIL's C code instead of a per-pixel loop.
+    """
+    return image.transpose(Image.Transpose.ROTATE_90).tobytes()
+
+
+# Grayscale level -> 2-bit code, as epd.getbuffer_4Gray() maps it: the top two
+# bits, except that exact 0xC0 and 0x80 are shifted down one level
+_GRAY4_LUT = [value >> 6 for value in range(256)]
+_GRAY4_LUT[0xC0] = 2
+_GRAY4_LUT[0x80] = 1
+
+
+def _pack_frame_4gray(image):
+    """Packs a landscape grayscale frame into the panel's portrait 2-bpp buffer.
+
+    Byte-for-byte the same as epd.getbuffer_4Gray() for a landscape image: the
+    2-bit codes come from a point() lookup and PIL's P;2 packer writes four
+    pixels per byte, replacing the driver's per-pixel Python loop.
+    """
+    codes = image.convert("L").transpose(Image.Transpose.ROTATE_90).point(_GRAY4_LUT)
+    # Reinterpret the codes as palette indices so the 2-bit packer accepts them
+    return Image.frombytes("P", codes.size, codes.tobytes()).tobytes("raw", "P;2")
+
+
+def update_display(epd, image, prev_image, full_refresh=False):
+    """Pushes a frame to the panel, refreshing only the changed region when possible.
+
+    Every EINK_PARTIAL_ERASURE_LIMIT partial updates a full refresh is forced to
+    clear accumulated ghosting; like any full refresh after partials, it first
+    re-initialises the panel. Returns True if the panel was updated.
+    """
+    erase_ghosting = state.partial_refresh_count >= EINK_PARTIAL_ERASURE_LIMIT
+    if full_refresh or prev_image is None or erase_ghosting:
+        if state.partial_refresh_count:
+            # display_Partial leaves the RAM window narrowed to its region and the
+            # border waveform changed; init() (SWRESET) restores both, as
+            # Waveshare's demo does before going back to full updates.
+            epd.init()
+        # display_Base writes both RAM banks so later partial updates diff correctly
+        epd.display_Base(_pack_frame(image))
+        state.partial_refresh_count = 0
+        if erase_ghosting:
+            logger.info("EPD fully refreshed to erase partial-update ghosting.")
+        else:
+            logger.info("EPD display updated.")
+        return True
+
+    box = _dirty_box(image, prev_image)
+    if box is None:
+        logger.debug("Frame unchanged, skipping EPD update.")
+        return False
+
+    epd.display_Partial(_pack_frame(image), *_panel_window(box, image.width))
+    state.partial_refresh_count += 1
+    logger.info("EPD partial update of region %s.", box)
+    return True
+
+
+def _bulk_epd_class(driver):
+    """Returns the driver's EPD class with frame data sent as bulk SPI transfers.
+
+    The stock driver clocks every byte out as its own SPI transaction (and CS
+    toggle), thousands per frame. These overrides send the same command
+    sequence but write each RAM bank in one spi_writebyte2() call, which
+    spidev splits into as few transfers as its buffer size allows. The SPI
+    clock is raised to EINK_SPI_SPEED_HZ after every init, since the driver
+    resets it when it (re)opens the bus. Full-frame writes also reset the RAM
+    window first, which the stock driver leaves narrowed after display_Partial.
+    """
+    epdconfig = driver.epdconfig
+
+    class BulkEPD(driver.EPD):
+        def _raise_spi_speed(self):
+            try:
+                epdconfig.SPI.max_speed_hz = EINK_SPI_SPEED_HZ
+                logger.debug("EPD SPI clock set to %d Hz.", epdconfig.SPI.max_speed_hz)
+            except (AttributeError, OSError, TypeError) as e:
+                logger.warning(f"Could not raise the EPD SPI clock, keeping the default: {e}")
+
+        def init(self):
+            result = super().init()
+            self._raise_spi_speed()
+            return result
+
+        def Init_4Gray(self):
+            result = super().Init_4Gray()
+            self._raise_spi_speed()
+            return result
+
+        def send_data_bulk(self, data):
+            epdconfig.digital_write(self.dc_pin, 1)
+            epdconfig.digital_write(self.cs_pin, 0)
+            epdconfig.spi_writebyte2(data)
+            epdconfig.digital_write(self.cs_pin, 1)
+
+        def _set_full_window(self):
+            # display_Partial narrows the RAM window and moves the address
+            # counters; full-frame writes must cover the whole panel again
+            # (data entry mode 0x03 from init(): x and y both increment from 0).
+            x_end = -(-self.width // 8) - 1
+            y_end = self.height - 1
+            self.send_command(0x44)  # RAM x start/end
+            self.send_data(0x00)
+            self.send_data(x_end & 0xFF)
+            self.send_command(0x45)  # RAM y start/end
+            self.send_data(0x00)
+            self.send_data(0x00)
+            self.send_data(y_end & 0xFF)
+            self.send_data((y_end >> 8) & 0x01)
+            self.send_command(0x4E)  # RAM x address counter
+            self.send_data(0x00)
+            self.send_command(0x4F)  # RAM y address counter
+            self.send_data(0x00)
+            self.send_data(0x00)
+
+        def Clear(self):
+            self._set_full_window()
+            self.send_command(0x24)
+            self.send_data_bulk(b"\xff" * (-(-self.width // 8) * self.height))
+            self.TurnOnDisplay()
+
+        def display_Base(self, image):
+            self._set_full_window()
+            self.send_command(0x24)  # Black/white RAM
+            self.send_data_bulk(image)
+            self.send_command(0x26)  # Previous-frame RAM used by partial updates
+            self.send_data_bulk(image)
+            self.TurnOnDisplay()
+
+        def display_Partial(self, image, Xstart, Ystart, Xend, Yend):
+            # Window in RAM units: x in whole bytes, end coordinates inclusive
+            row_bytes = -(-self.width // 8)
+            x0, x1 = Xstart // 8, -(-Xend // 8) - 1
+            y0, y1 = Ystart, Yend - 1
+
+            self.reset()
+            self.send_command(0x3C)  # Border waveform
+            self.send_data(0x80)
+            self.send_command(0x44)  # RAM x start/end
+            self.send_data(x0 & 0xFF)
+            self.send_data(x1 & 0xFF)
+            self.send_command(0x45)  # RAM y start/end
+            self.send_data(y0 & 0xFF)
+            self.send_data((y0 >> 8) & 0x01)
+            self.send_data(y1 & 0xFF)
+            self.send_data((y1 >> 8) & 0x01)
+            self.send_command(0x4E)  # RAM x address counter
+            self.send_data(x0 & 0xFF)
+            self.send_command(0x4F)  # RAM y address counter
+            self.send_data(y0 & 0xFF)
+            self.send_data((y0 >> 8) & 0x01)
+
+            self.send_command(0x24)
+            self.send_data_bulk(
+                b"".join(
+                    image[row * row_bytes + x0 : row * row_bytes + x1 + 1]
+                    for row in range(y0, y1 + 1)
+                )
+            )
+            self.TurnOnDisplay_Partial()
+
+    return BulkEPD
+
+
 # --- e-Ink GPIO Button Handlers ---
+def _wake_for_input():
+    """Wakes the render loop for a button press once input has been quiet briefly."""
+    state.input_quiet_deadline = time.monotonic() + INPUT_QUIET_S
+    redraw_event.set()
+
+
 def handle_short_press(button_pin):
-    global current_screen_index, force_redraw, qrcode_mode_active
-    if qrcode_mode_active:
-        return
-    logger.info(f"Short press detected on GPIO {button_pin}")
+    logger.info("Short press detected on GPIO %s", button_pin)
     if button_pin == KEY2_PIN:
-        current_screen_index = 0
+        state.current_screen_index = 0
     elif button_pin == KEY3_PIN:
-        current_screen_index = 1
+        state.current_screen_index = 1
     elif button_pin == KEY4_PIN:
-        current_screen_index = 2
-    force_redraw = True
+        state.current_screen_index = 2
+    _wake_for_input()
 
 
-def handle_refresh_press(pihole_client_creator, pihole_auth, api_token):
-    global last_data_refresh_time, force_redraw, qrcode_mode_active, connection_failed_at_boot, pihole
-    if qrcode_mode_active:
-        return
+def handle_refresh_press(pihole_client_creator, config):
     logger.info("Short press detected on refresh button.")
-    last_data_refresh_time = 0
-    force_redraw = True
-    if connection_failed_at_boot:
-        pihole = pihole_client_creator(pihole_auth, api_token)
-        if pihole:
-            connection_failed_at_boot = False  # Allow retry
+    state.last_data_refresh_time = 0
+    clear_padd_summary_cache()
+    if state.connection_failed_at_boot:
+        # Release the stale client's HTTP session and API seat before reconnecting,
+        # so only one pooled keep-alive session is ever in use.
+        if state.pihole is not None:
+            try:
+                state.pihole.close_session()
+            except Exception as e:
+                logger.debug(f"Could not close previous Pi-hole session: {e}")
+        state.pihole = pihole_client_creator(config.auth, config.token)
+        if state.pihole:
+            state.connection_failed_at_boot = False  # Allow retry
+    _wake_for_input()
 
 
 def handle_qrcode_toggle():
-    global qrcode_mode_active, force_redraw
     logger.info("Long press detected, toggling QR code mode.")
-    qrcode_mode_active = not qrcode_mode_active
-    force_redraw = True
+    state.qrcode_mode_active = not state.qrcode_mode_active
+    _wake_for_input()
 
 
 # --- Data Fetching ---
+def _publish_data(data):
+    """Replaces any unconsumed summary in the queue with the newest one."""
+    try:
+        _data_queue.get_nowait()
+    except queue.Empty:
+        pass
+    _data_queue.put_nowait(data)
+
+
+def _fetch_data():
+    """Fetches a PADD summary for the render loop and wakes it to redraw.
+
+    Does nothing if a fetch is already in flight, and skips the redraw when
+    the summary is identical to the one on screen.
+    """
+    if not _fetch_lock.acquire(blocking=False):
+        return
+    try:
+        if state.pihole is None:
+            state.last_data_refresh_time = time.monotonic()
+            return
+        logger.info("Refreshing data from Pi-hole API in background...")
+        data = get_padd_summary_cached(state.pihole, full=True)
+        if data == state.padd_data:
+            # Nothing changed: mark the data fresh but leave the screen alone
+            logger.info("Pi-hole data unchanged; skipping redraw.")
+            state.last_data_refresh_time = time.monotonic()
+            return
+        _publish_data(data)
+        redraw_event.set()
+    except Exception as e:
+        # Keep showing the last good data. Count the attempt as a refresh so that
+        # redraws do not retry it; the next scheduled refresh tries again.
+        logger.error(f"Failed to get data from Pi-hole: {e}")
+        state.last_data_refresh_time = time.monotonic()
+    finally:
+        _fetch_lock.release()
+
+
+def _start_fetch():
+    """Starts a background fetch unless one is already in flight."""
+    if not _fetch_lock.locked():
+        threading.Thread(target=_fetch_data, name="padd-refresh", daemon=True).start()
+
+
 def refresh_data(pihole):
-    """Fetches PADD summary data from the Pi-hole v6 API."""
-    global last_data_refresh_time, padd_data
-    current_time = time.time()
-    if current_time - last_data_refresh_time > 120 or not padd_data:
+    """Updates padd_data from the background fetch without blocking.
+
+    The API is only called inline when there is no data yet (boot). A refresh
+    requested by the user keeps serving the current data while a background
+    fetch runs, and the screen is redrawn once it lands.
+    """
+    try:
+        state.padd_data = _data_queue.get_nowait()
+        state.last_data_refresh_time = time.monotonic()
+        logger.info("Data refresh complete.")
+    except queue.Empty:
+        pass
+
+    current_time = time.monotonic()
+    if not state.padd_data:
         logger.info("Refreshing data from Pi-hole API...")
         try:
-            padd_data = pihole.get_padd_summary(full=True)
-            last_data_refresh_time = current_time
+            state.padd_data = get_padd_summary_cached(pihole, full=True)
+            state.last_data_refresh_time = current_time
             logger.info("Data refresh complete.")
         except Exception as e:
             logger.error(f"Failed to get data from Pi-hole: {e}")
-            padd_data = {}
+            state.padd_data = {}
+    elif not state.last_data_refresh_time:
+        _start_fetch()
+
+    if state.padd_data:
+        # Format once per refresh so redraws only lay out the cached strings
+        _padd_strings(state.padd_data)
 
 
 # --- Main Dispatcher & e-Ink Runner ---
 def run_eink_display(
     pihole_client,
-    pihole_url,
-    pihole_auth,
-    api_token,
+    config,
     pihole_client_creator,
     splash_duration,
     rotate_interval,
     __version__,
+    refresh_interval=120,
 ):
     """Initializes and runs the e-Ink display loop."""
     from gpiozero import Button
     import epaper
 
-    global padd_data, force_redraw, current_screen_index, last_data_refresh_time, qrcode_mode_active, pihole, connection_failed_at_boot
-    pihole = pihole_client
+    state.pihole = pihole_client
     epd = None
     try:
-        epd = epaper.epaper("epd2in7_V2").EPD()
+        epd = _bulk_epd_class(epaper.epaper("epd2in7_V2"))()
         epd.init()
         epd.Clear()
         epd.Init_4Gray()
@@ -433,99 +914,183 @@ def run_eink_display(
         width, height = epd.height, epd.width
         logger.info(f"Screen dimensions set to {width}x{height}")
 
-        splash_logo_image = Image.open(LOGO_PATH) if os.path.exists(LOGO_PATH) else None
-        header_logo_image = (
-            Image.open(HEADER_LOGO_PATH) if os.path.exists(HEADER_LOGO_PATH) else None
+        # Decode and grayscale the splash logo once, as the 4-gray panel wants it
+        splash_logo_image = _load_image(LOGO_PATH)
+        if splash_logo_image:
+            splash_logo_image = splash_logo_image.convert("L")
+        header = prepare_header(
+            width, prepare_header_logo(_load_image(HEADER_LOGO_PATH))
         )
 
+        # Fetch the first summary while the splash refreshes and stays on screen,
+        # so the network round trip is hidden behind the splash duration
+        boot_fetch = threading.Thread(target=_fetch_data, name="padd-boot-fetch", daemon=True)
+        boot_fetch.start()
         draw_splash_screen(epd, splash_logo_image, width, height)
         time.sleep(splash_duration)
+        boot_fetch.join()
 
-        if not padd_data:
+        if not state.padd_data:
             logger.info("Attempting initial connection to Pi-hole...")
             for i in range(3):
-                refresh_data(pihole)
-                if padd_data:
+                refresh_data(state.pihole)
+                if state.padd_data:
                     break
                 logger.warning(
                     f"Initial connection attempt {i+1}/3 failed. Retrying in 5 seconds..."
                 )
                 time.sleep(5)
 
-            if not padd_data:
+            if not state.padd_data:
                 logger.error("Could not connect to Pi-hole after 3 attempts.")
-                connection_failed_at_boot = True
-                force_redraw = True
+                state.connection_failed_at_boot = True
 
         epd.init()
         epd.Clear()
 
+        button_options = dict(pull_up=True, bounce_time=BUTTON_DEBOUNCE_S)
         button1 = Button(
-            KEY1_PIN, pull_up=True, bounce_time=BUTTON_DEBOUNCE_S, hold_time=BUTTON_HOLD_S
+            KEY1_PIN, hold_time=BUTTON_HOLD_S, hold_repeat=False, **button_options
         )
         button2, button3, button4 = (
-            Button(KEY2_PIN, pull_up=True, bounce_time=BUTTON_DEBOUNCE_S),
-            Button(KEY3_PIN, pull_up=True, bounce_time=BUTTON_DEBOUNCE_S),
-            Button(KEY4_PIN, pull_up=True, bounce_time=BUTTON_DEBOUNCE_S),
-        )
-        button1.when_pressed = lambda: handle_refresh_press(
-            pihole_client_creator, pihole_auth, api_token
+            Button(KEY2_PIN, **button_options),
+            Button(KEY3_PIN, **button_options),
+            Button(KEY4_PIN, **button_options),
         )
-        button1.when_held = handle_qrcode_toggle
-        button2.when_pressed, button3.when_pressed, button4.when_pressed = (
-            lambda: handle_short_press(KEY2_PIN),
-            lambda: handle_short_press(KEY3_PIN),
-            lambda: handle_short_press(KEY4_PIN),
+        press_callbacks = (
+            (button1, partial(handle_refresh_press, pihole_client_creator, config)),
+            (button2, partial(handle_short_press, KEY2_PIN)),
+            (button3, partial(handle_short_press, KEY3_PIN)),
+            (button4, partial(handle_short_press, KEY4_PIN)),
         )
 
+        def bind_press_callbacks():
+            # Presses do nothing while the QR code is shown; holding key 1 exits
+            for button, callback in press_callbacks:
+                button.when_pressed = None if state.qrcode_mode_active else callback
+
+        def toggle_qrcode():
+            handle_qrcode_toggle()
+            bind_press_callbacks()
+
+        bind_press_callbacks()
+        button1.when_held = toggle_qrcode
+
         screens = [draw_pihole_stats_screen, draw_system_info_screen, draw_version_screen]
         num_screens = len(screens)
-        last_screen_rotate_time = time.time()
+        # Periodic jobs as a heap of (monotonic deadline, job); the loop sleeps
+        # until the earliest one is due.
+        periods = {"rotate": rotate_interval, "refresh": refresh_interval}
+        scheduler = [(time.monotonic() + period, job) for job, period in periods.items()]
+        heapq.heapify(scheduler)
+        drawn_minute = None
+        # Two persistent frame buffers: each redraw clears and draws into the back
+        # buffer, diffs it against the front (displayed) one, then they swap.
+        frames = [Image.new("1", (width, height), WHITE) for _ in range(2)]
+        frame_draws = [ImageDraw.Draw(frame) for frame in frames]
+        back_buffer = 0
+        prev_image = None
+        prev_screen_key = None
+        drawn_data = None
+
+        redraw_event.set()  # Draw the first frame straight away
 
         while True:
+            # Sleep until a button or finished fetch wakes us, a scheduled job is
+            # due or the header clock's minute rolls over (the QR screen has no clock).
+            timeout = scheduler[0][0] - time.monotonic()
+            if not state.qrcode_mode_active:
+                timeout = min(timeout, 60 - time.time() % 60 + CLOCK_TICK_MARGIN_S)
+            redraw = redraw_event.wait(max(0, timeout))
+            redraw_event.clear()
+
+            now = time.monotonic()
+            while scheduler[0][0] <= now:
+                deadline, job = scheduler[0]
+                if job == "rotate":
+                    # Screens do not rotate while the QR code or boot error is shown
+                    if not state.qrcode_mode_active and not state.connection_failed_at_boot:
+                        state.current_screen_index = (
+                            state.current_screen_index + 1
+                        ) % num_screens
+                        redraw = True
+                else:
+                    _start_fetch()  # Wakes the loop again once the data lands
+                # Advance from the previous deadline so jobs do not drift; after a
+                # stall restart the interval from now.
+                deadline += periods[job]
+                if deadline <= now:
+                    deadline = now + periods[job]
+                heapq.heapreplace(scheduler, (deadline, job))
+
+            clock_tick = (
+                not state.qrcode_mode_active and int(time.time() // 60) != drawn_minute
+            )
+            if not (redraw or clock_tick):
+                continue
+
+            # Let a burst of button presses settle so it costs one panel update
+            while (quiet := state.input_quiet_deadline - time.monotonic()) > 0:
+                redraw_event.wait(quiet)
+                redraw_event.clear()
+
+            screen_key = (
+                state.connection_failed_at_boot,
+                state.qrcode_mode_active,
+                state.current_screen_index,
+            )
+            if not (state.connection_failed_at_boot or state.qrcode_mode_active):
+                refresh_data(state.pihole)
+            # Same screen, same minute and the same data snapshot would render the
+            # frame already on the panel (e.g. pressing the key for the screen
+            # being shown, or a refresh press before the new data lands)
+            minute = int(time.time() // 60)
             if (
-                not qrcode_mode_active
-                and not connection_failed_at_boot
-                and time.time() - last_screen_rotate_time > rotate_interval
+                screen_key == prev_screen_key
+                and minute == drawn_minute
+                and state.padd_data is drawn_data
             ):
-                current_screen_index = (current_screen_index + 1) % num_screens
-                force_redraw = True
-                last_screen_rotate_time = time.time()
-
-            if force_redraw:
-                image = Image.new("1", (width, height), WHITE)
-                draw = ImageDraw.Draw(image)
-
-                if connection_failed_at_boot:
-                    header_bottom_y = draw_header(draw, width, header_logo_image)
-                    draw_connection_failed_screen(
-                        draw, width, height, header_bottom_y, pihole_auth.split("//")[1]
-                    )
-                elif qrcode_mode_active:
-                    draw_qrcode_screen(draw, width, height, pihole_url)
-                else:
-                    refresh_data(pihole)
-                    logger.info(
-                        f"Drawing screen {current_screen_index + 1}/{num_screens}..."
-                    )
-                    header_bottom_y = draw_header(draw, width, header_logo_image)
-                    screens[current_screen_index](
-                        draw, width, height, padd_data, header_bottom_y, __version__
-                    )
+                continue
 
-                epd.display(epd.getbuffer(image))
-                logger.info("EPD display updated.")
-                force_redraw = False
+            image, draw = frames[back_buffer], frame_draws[back_buffer]
+            draw.rectangle((0, 0, width, height), fill=WHITE)
 
-            time.sleep(0.1)
+            if state.connection_failed_at_boot:
+                header_bottom_y = draw_header(draw, width, header)
+                draw_connection_failed_screen(
+                    draw, width, height, header_bottom_y, config.ip
+                )
+            elif state.qrcode_mode_active:
+                draw_qrcode_screen(draw, width, height, config.url)
+            else:
+                logger.info(
+                    "Drawing screen %d/%d...", state.current_screen_index + 1, num_screens
+                )
+                header_bottom_y = draw_header(draw, width, header)
+                screens[state.current_screen_index](
+                    draw, width, height, state.padd_data, header_bottom_y, __version__
+                )
+
+            # Switching screens repaints everything; same-screen redraws only
+            # push the region that actually changed.
+            update_display(
+                epd, image, prev_image, full_refresh=screen_key != prev_screen_key
+            )
+            prev_image, prev_screen_key = image, screen_key
+            drawn_minute, drawn_data = minute, state.padd_data
+            back_buffer ^= 1
 
     except KeyboardInterrupt:
         logger.info("Exit signal received.")
-        if pihole_client is not None:
-            pihole_client.close_session()
+        if state.pihole is not None:
+            state.pihole.close_session()
     except Exception as e:
         logger.error(f"An unexpected error occurred in e-Ink mode: {e}", exc_info=True)
     finally:
         if epd:
+            if state.partial_refresh_count:
+                # Same rule as update_display: restore the full-update state
+                # that display_Partial changed before the final full refresh.
+                epd.init()
             epd.Clear()
             epd.sleep()
@@ -1,10 +1,16 @@
+import os
+import math
+import asyncio
 import logging
+import time
 from textual.app import App, ComposeResult
+from textual.widget import Widget
 from textual.widgets import Header, Footer, Static, ProgressBar, Rule, Link, Button
 from textual.containers import VerticalScroll, Container, Center, Grid
 from textual.screen import ModalScreen
 from textual import work
 from rich.emoji import Emoji
+from rich.text import Text
 
 from . import (
     format_uptime,
@@ -13,13 +19,69 @@ from . import (
     heatmap_generator,
     generate_qrascii,
     check_padd_eink_version,
+    get_padd_summary_cached,
+    clear_padd_summary_cache,
+    PADD_SUMMARY_TTL_SECONDS,
 )
 
 logger = logging.getLogger(__name__)
 
+# CPU temperature indicators, built once instead of on every refresh
+CPU_TEMP_HOT = f"{Emoji('thumbs_down')} {Emoji('fire')}"
+CPU_TEMP_WARM = f"{Emoji('thumbs_up')} {Emoji('thermometer')}"
+CPU_TEMP_OK = f"{Emoji('thumbs_up')} {Emoji('ok_hand')}"
+
+# Fixed placeholder messages, pre-built so Rich never re-parses them as markup
+LOADING_TEXT = Text("Loading...")
+REFRESHING_TEXT = Text("Refreshing...")
+EMPTY_TEXT = Text("")
+NO_PIHOLE_DATA_TEXT = Text("No Pi-hole data available.")
+NO_FTL_DATA_TEXT = Text("No FTL data available.")
+NO_VERSION_DATA_TEXT = Text("Version data not available.")
+
+# (label, key in the PADD "version" section) for each component, in display order
+VERSION_COMPONENTS = (("Pi-hole", "core"), (" Web UI", "web"), ("    FTL", "ftl"))
+
 
 # --- Textual TUI Widgets ---
-class PiHoleStats(Static):
+class StatLines(Widget):
+    """A panel that renders each line as its own Static and only re-renders changed lines."""
+
+    DEFAULT_CSS = """
+    StatLines {
+        height: auto;
+    }
+    """
+
+    def __init__(self, content: str | Text = "", **kwargs):
+        super().__init__(**kwargs)
+        self._lines = [content]
+        self._line_widgets = [Static(content)]
+
+    def compose(self) -> ComposeResult:
+        yield from self._line_widgets
+
+    def update(self, content: str | Text) -> None:
+        """Replaces all lines with a single message, e.g. loading or an error."""
+        self.update_lines([content])
+
+    def update_lines(self, lines: list[str | Text]) -> None:
+        """Updates the line widgets whose markup changed, adding or removing lines as needed."""
+        for index, line in enumerate(lines):
+            if index < len(self._line_widgets):
+                if self._lines[index] != line:
+                    self._line_widgets[index].update(line)
+            else:
+                line_widget = Static(line)
+                self._line_widgets.append(line_widget)
+                self.mount(line_widget)
+        for line_widget in self._line_widgets[len(lines):]:
+            line_widget.remove()
+        del self._line_widgets[len(lines):]
+        self._lines = list(lines)
+
+
+class PiHoleStats(StatLines):
     """A widget to display Pi-hole statistics."""
 
     def on_mount(self) -> None:
@@ -35,7 +97,7 @@ class PiHoleStats(Static):
             self.update(f"[bold red]{padd_data['error']}[/]")
             return
         if not padd_data:
-            self.update("No Pi-hole data available.")
+            self.update(NO_PIHOLE_DATA_TEXT)
             return
 
         data = padd_data
@@ -55,10 +117,10 @@ class PiHoleStats(Static):
             f"[bold]Top Client:[/bold] {data.get('top_client', 'N/A')}",
             f"[bold]Clients:[/bold]    {data.get('active_clients', 0)}",
         ]
-        self.update("\n".join(lines))
+        self.update_lines(lines)
 
 
-class FTLStats(Static):
+class FTLStats(StatLines):
     """A widget to display FTL statistics."""
 
     def on_mount(self) -> None:
@@ -74,13 +136,13 @@ class FTLStats(Static):
             self.update(f"[bold red]{padd_data['error']}[/]")
             return
         if not padd_data:
-            self.update("No FTL data available.")
+            self.update(NO_FTL_DATA_TEXT)
             return
 
         cache = padd_data.get("cache", {})
         
         #Generate the ASCII bar for CPU
-        cpu_per = padd_data.get("%cpu", [0.0])
+        cpu_per = padd_data.get("%cpu", 0.0)
         cpu_color = heatmap_generator(cpu_per)
 
         # Generate the ASCII bar for Memory
@@ -96,10 +158,10 @@ class FTLStats(Static):
             f"  [bold]Inserted:[/bold] {cache.get('inserted', 0):,}",
             f"  [bold]Evicted:[/bold]  {cache.get('evicted', 0):,}",
         ]
-        self.update("\n".join(lines))
+        self.update_lines(lines)
 
 
-class SystemStats(Static):
+class SystemStats(StatLines):
 
     """A widget to display system statistics."""
 
@@ -111,50 +173,52 @@ class SystemStats(Static):
 
     def update_content(self, padd_data: dict) -> None:
         if not padd_data or padd_data.get("error"):
-            self.update("")  # Clear on error
+            self.update(EMPTY_TEXT)  # Clear on error
             return
 
         data = padd_data
-        system = data.get("system", {})
+        # Bind each nested section once instead of re-walking .get() chains
+        system = data.get("system") or {}
+        cpu = system.get("cpu") or {}
+        load_raw = (cpu.get("load") or {}).get("raw") or [0.0, 0.0, 0.0]
+        ipv4 = (data.get("iface") or {}).get("v4") or {}
 
         # Generate the ASCII bar for CPU
-        cpu_per = system.get("cpu", {}).get("%cpu", [0.0])
+        cpu_per = cpu.get("%cpu", 0.0)
         cpu_bar = generate_ascii_bar(cpu_per, total_width=40)
         cpu_color = heatmap_generator(cpu_per)
 
         # Generate the ASCII bar for Memory
-        mem_load = system.get("memory", {}).get("ram", {}).get("%used", 0.0)
+        mem_load = ((system.get("memory") or {}).get("ram") or {}).get("%used", 0.0)
         mem_bar = generate_ascii_bar(mem_load, total_width=40)
         mem_color = heatmap_generator(mem_load)
 
         # CPU temperature colors
-        cpu_temp = data.get("sensors", {}).get("cpu_temp", 0.0)
+        cpu_temp = (data.get("sensors") or {}).get("cpu_temp", 0.0)
 
         if cpu_temp > 80:
-            cpu_emoji = str(Emoji("thumbs_down")) + " " + str(Emoji("fire"))
+            cpu_emoji = CPU_TEMP_HOT
         elif cpu_temp >= 60:
-            cpu_emoji = str(Emoji("thumbs_up")) + " " + str(Emoji("thermometer"))
+            cpu_emoji = CPU_TEMP_WARM
         else:
-            cpu_emoji = str(Emoji("thumbs_up")) + " " + str(Emoji("ok_hand"))
+            cpu_emoji = CPU_TEMP_OK
 
         color = heatmap_generator(cpu_temp)
 
-        cpu_load_1 = system.get("cpu", {}).get("load", {}).get("raw", [0.0])[0]
+        cpu_load_1, cpu_load_5, cpu_load_15 = load_raw[:3]
         cpu_load_1_color = heatmap_generator(cpu_load_1)
-        cpu_load_5 = system.get("cpu", {}).get("load", {}).get("raw", [0.0])[1]
         cpu_load_5_color = heatmap_generator(cpu_load_5)
-        cpu_load_15 = system.get("cpu", {}).get("load", {}).get("raw", [0.0])[2]
         cpu_load_15_color = heatmap_generator(cpu_load_15)
 
         lines = [
-            f"[bold]Host:[/bold]       {data.get('node_name', 'N/A')} ({data.get('iface', {}).get('v4', {}).get('addr', 'N/A')})",
+            f"[bold]Host:[/bold]       {data.get('node_name', 'N/A')} ({ipv4.get('addr', 'N/A')})",
             f"[bold]CPU Used:[/bold]   {cpu_bar} [{cpu_color}]{cpu_per:.1f}%[/{cpu_color}]",
             f"[bold]CPU Load:[/bold]   [{cpu_load_1_color}]{cpu_load_1:.2f}[/{cpu_load_1_color}], [{cpu_load_5_color}]{cpu_load_5:.2f}[/{cpu_load_5_color}], [{cpu_load_15_color}]{cpu_load_15:.2f}[/{cpu_load_15_color}]",
             f"[bold]Memory:[/bold]     {mem_bar} [{mem_color}]{mem_load:.1f}%[/{mem_color}]",
             f"[bold]Uptime:[/bold]     {format_uptime(system.get('uptime', 0))}"
             f"	[bold]CPU Temp:[/bold]   [{color}]{cpu_temp:.1f}°C[/{color}]   {cpu_emoji}",
         ]
-        self.update("\n".join(lines))
+        self.update_lines(lines)
 
 
 class AdminUrlModal(ModalScreen):
@@ -204,7 +268,7 @@ class PiHoleVersions(Container):
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the container."""
-        yield Static("Loading...", id="version-text")
+        yield StatLines(LOADING_TEXT, id="version-text")
         yield ProgressBar(
             total=100,
             show_eta=False,
@@ -226,14 +290,14 @@ class PiHoleVersions(Container):
             self.app.push_screen(AdminUrlModal(self.pihole_url))
 
     def update_content(self, padd_data: dict) -> None:
-        version_text_widget = self.query_one("#version-text")
+        version_text_widget = self.query_one("#version-text", StatLines)
         if not padd_data or padd_data.get("error"):
-            version_text_widget.update("")  # Clear on error
+            version_text_widget.update(EMPTY_TEXT)  # Clear on error
             return
 
         version_data = padd_data.get("version")
         if not version_data:
-            version_text_widget.update("Version data not available.")
+            version_text_widget.update(NO_VERSION_DATA_TEXT)
             return
 
         any_updates = False
@@ -244,8 +308,7 @@ class PiHoleVersions(Container):
         if "**" in padd_eink_version_line:
             any_updates = True
 
-        components = {"Pi-hole": "core", " Web UI": "web", "    FTL": "ftl"}
-        for name, key in components.items():
+        for name, key in VERSION_COMPONENTS:
             comp_data = version_data.get(key)
             if not comp_data:
                 lines.append(f"[bold]{name}:[/bold]\tN/A")
@@ -270,7 +333,7 @@ class PiHoleVersions(Container):
                 f"\t[bold green]{checkmark} {checkmark} SYSTEM IS HEALTHY {checkmark} {checkmark}[/bold green]"
             )
 
-        version_text_widget.update("\n".join(lines))
+        version_text_widget.update_lines(lines)
 
 
 # --- Textual TUI Application (Main App Class) ---
@@ -284,22 +347,54 @@ class PADD_TUI(App):
         ("q", "quit", "Quit"),
     ]
 
-    TUI_REFRESH_INTERVAL = 60
+    TUI_REFRESH_INTERVAL = 60  # Default; override with the TUI_REFRESH_INTERVAL env var
+    PROGRESS_TICK_INTERVAL = 5
 
-    def __init__(self, pihole_client, pihole_url, __version__):
+    def __init__(self, pihole_client, config, __version__):
         super().__init__()
         self.pihole = pihole_client
-        self.pihole_url = pihole_url
+        self.pihole_url = config.url
         self.__version__ = __version__
-        self.countdown = self.TUI_REFRESH_INTERVAL
+        self._cycle_start = time.monotonic()
+        self._progress_bar = None
+        self._progress_bucket = None
+        self._refresh_timer = None
+        # Read here rather than at import so values from .env are picked up
+        self.refresh_interval = self._refresh_interval_from_env()
+
+    def _refresh_interval_from_env(self) -> float:
+        """Returns TUI_REFRESH_INTERVAL in seconds, falling back to the default.
+
+        Intervals shorter than the summary cache TTL would only re-serve the
+        cached summary, so they are raised to it.
+        """
+        value = os.environ.get("TUI_REFRESH_INTERVAL")
+        if value is None:
+            return self.TUI_REFRESH_INTERVAL
+        try:
+            interval = float(value)
+            if not math.isfinite(interval):
+                raise ValueError(value)
+        except ValueError:
+            logger.warning(
+                f"Invalid TUI_REFRESH_INTERVAL {value!r}, using {self.TUI_REFRESH_INTERVAL}s."
+            )
+            return self.TUI_REFRESH_INTERVAL
+        if interval < PADD_SUMMARY_TTL_SECONDS:
+            logger.warning(
+                f"TUI_REFRESH_INTERVAL {value!r} is below the {PADD_SUMMARY_TTL_SECONDS}s "
+                f"data cache lifetime, using {PADD_SUMMARY_TTL_SECONDS}s."
+            )
+            return PADD_SUMMARY_TTL_SECONDS
+        return interval
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header()
         with VerticalScroll(id="main-container"):
-            yield PiHoleStats("Loading...")
-            yield FTLStats("Loading...")
-            yield SystemStats("Loading...")
+            yield PiHoleStats(LOADING_TEXT)
+            yield FTLStats(LOADING_TEXT)
+            yield SystemStats(LOADING_TEXT)
             yield PiHoleVersions(
                 self.pihole_url, self.__version__, id="sidebar"
             )  # Container doesn't need initial content
@@ -307,54 +402,68 @@ class PADD_TUI(App):
 
     def on_mount(self) -> None:
         """Called when the app is mounted."""
+        self._progress_bar = self.query_one(ProgressBar)
         self.run_update_worker()
-        self.set_interval(self.TUI_REFRESH_INTERVAL, self.run_update_worker)
-        self.set_interval(1, self.tick_progress_bar)  # Timer for progress bar
+        self.set_interval(self.PROGRESS_TICK_INTERVAL, self.tick_progress_bar)
         self.title = f"PADD-eInk Terminal Mode v{self.__version__}"
 
     def tick_progress_bar(self) -> None:
-        """Updates the progress bar every second."""
-        self.countdown -= 1
-        progress = (self.countdown / self.TUI_REFRESH_INTERVAL) * 100
-        self.query_one(ProgressBar).progress = progress
+        """Updates the progress bar from the time elapsed in the current refresh cycle."""
+        elapsed = time.monotonic() - self._cycle_start
+        progress = max(0, 100 * (1 - elapsed / self.refresh_interval))
+        # Only repaint when the whole-percent value actually moves
+        bucket = int(progress)
+        if bucket == self._progress_bucket:
+            return
+        self._progress_bucket = bucket
+        self._progress_bar.progress = progress
 
     def run_update_worker(self) -> None:
         """Initiates the background data fetching worker and resets countdown."""
-        self.countdown = self.TUI_REFRESH_INTERVAL  # Reset countdown on refresh
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
+        self._cycle_start = time.monotonic()  # Restart the countdown on refresh
         self.update_data()
 
-    @work(thread=True, exclusive=True)
-    def update_data(self) -> None:
-        """Fetches new data and updates the widgets from a background thread."""
+    @work(exclusive=True)
+    async def update_data(self) -> None:
+        """Fetches new data without blocking the event loop and updates the widgets."""
         logger.info("TUI: Refreshing data in worker...")
         try:
-            padd_data = self.pihole.get_padd_summary(full=True)
+            # pihole6api is synchronous; run only the HTTP call off the event loop
+            padd_data = await asyncio.to_thread(
+                get_padd_summary_cached, self.pihole, full=True
+            )
 
             # Call the update methods on each custom widget
-            self.call_from_thread(self.query_one(PiHoleStats).update_content, padd_data)
-            self.call_from_thread(self.query_one(FTLStats).update_content, padd_data)
-            self.call_from_thread(self.query_one(SystemStats).update_content, padd_data)
-            self.call_from_thread(
-                self.query_one(PiHoleVersions).update_content, padd_data
-            )
+            self.query_one(PiHoleStats).update_content(padd_data)
+            self.query_one(FTLStats).update_content(padd_data)
+            self.query_one(SystemStats).update_content(padd_data)
+            self.query_one(PiHoleVersions).update_content(padd_data)
 
             logger.info("TUI: Display updated by worker.")
         except Exception as e:
             error_message = f"Error fetching data: {e}"
             logger.error(error_message)
-            self.call_from_thread(
-                self.query_one(PiHoleStats).update_content, {"error": error_message}
-            )
+            self.query_one(PiHoleStats).update_content({"error": error_message})
+
+        # Schedule the next refresh only once this one has finished, so a slow
+        # Pi-hole never has two requests in flight. A worker cancelled by a
+        # manual refresh never gets here and leaves the scheduling to its successor.
+        self._cycle_start = time.monotonic()
+        self._refresh_timer = self.set_timer(
+            self.refresh_interval, self.run_update_worker
+        )
 
     def action_refresh(self) -> None:
         """Called when the user presses the 'r' key."""
+        clear_padd_summary_cache()
         # Update widgets to show a refreshing message
-        self.query_one(PiHoleStats).update("Refreshing...")
-        self.query_one(FTLStats).update("Refreshing...")
-        self.query_one(SystemStats).update("Refreshing...")
-        self.query_one(PiHoleVersions).query_one("#version-text").update(
-            "Refreshing..."
-        )
+        self.query_one(PiHoleStats).update(REFRESHING_TEXT)
+        self.query_one(FTLStats).update(REFRESHING_TEXT)
+        self.query_one(SystemStats).update(REFRESHING_TEXT)
+        self.query_one(PiHoleVersions).query_one("#version-text").update(REFRESHING_TEXT)
         self.run_update_worker()
 
     def action_quit(self) -> None:
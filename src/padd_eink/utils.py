@@ -1,7 +1,11 @@
 import io
+import time
+from functools import lru_cache
 import qrcode
-import lastversion
-from apscheduler.schedulers.background import BackgroundScheduler
+from packaging.version import InvalidVersion, Version
+
+# lastversion (and the requests stack under it) and apscheduler are imported in
+# the version-check functions, so importing the package stays cheap
 
 # Global variable to cache the latest version
 latest_padd_eink_version = None
@@ -9,6 +13,8 @@ latest_padd_eink_version = None
 def _update_latest_version():
     """Fetches the latest version from GitHub and updates the global variable."""
     global latest_padd_eink_version
+    import lastversion
+
     try:
         repo = "falkyre/padd-eink"
         latest_version = lastversion.latest(repo, output_format='version', pre_ok=False)
@@ -18,13 +24,32 @@ def _update_latest_version():
         # or it will remain None on first failure.
         pass
 
-# Initialize and start the scheduler
-scheduler = BackgroundScheduler()
-# Run immediately, and then every 3 hours
-scheduler.add_job('padd_eink.utils:_update_latest_version', 'interval', hours=3, misfire_grace_time=60)
-scheduler.start()
-# Run the job once at startup
-_update_latest_version()
+# Cache of PADD summaries: {full: (fetched_at, data)}
+_padd_summary_cache = {}
+# Shorter than either refresh interval so the timed refreshes always refetch,
+# while extra requests in between are served from the cache.
+PADD_SUMMARY_TTL_SECONDS = 30
+
+# Background scheduler for the version check, started by start_version_check()
+scheduler = None
+
+
+def start_version_check():
+    """Checks for a new PADD-eInk release now, then every 3 hours in the background.
+
+    Called once from main() rather than at import time, so importing the
+    package (e.g. for --help) never blocks on the network.
+    """
+    global scheduler
+    if scheduler is not None:
+        return
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    scheduler = BackgroundScheduler()
+    scheduler.add_job('padd_eink.utils:_update_latest_version', 'interval', hours=3, misfire_grace_time=60)
+    scheduler.start()
+    # Run the job once at startup
+    _update_latest_version()
 
 
 def check_padd_eink_version(current_version, output_format="tui"):
@@ -61,47 +86,90 @@ def check_padd_eink_version(current_version, output_format="tui"):
             return f"PADD-eInk:	v{current_version} ?"
 
 
+def get_padd_summary_cached(pihole_client, full=True, ttl=PADD_SUMMARY_TTL_SECONDS):
+    """
+    Returns the PADD summary, reusing a recent response if it is younger than ttl.
+
+    Args:
+        pihole_client (PiHole6Client): The connected Pi-hole API client.
+        full (bool): Whether to request the full PADD dataset.
+        ttl (float): Maximum age in seconds of a cached response.
+
+    Returns:
+        dict: The PADD summary data.
+    """
+    now = time.monotonic()
+    cached = _padd_summary_cache.get(full)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    data = pihole_client.get_padd_summary(full=full)
+    _padd_summary_cache[full] = (now, data)
+    return data
+
+
+def clear_padd_summary_cache():
+    """Drops any cached PADD summary so the next request hits the API."""
+    _padd_summary_cache.clear()
+
+
 def format_uptime(seconds):
     """Converts seconds into a human-readable Xd Yh Zm format."""
     try:
-        secs = int(seconds)
-        days = secs // (24 * 3600)
-        secs %= 24 * 3600
-        hours = secs // 3600
-        secs %= 3600
-        minutes = secs // 60
-        return f"{days}d {hours}h {minutes}m"
+        return _format_uptime_minutes(int(seconds) // 60)
     except (ValueError, TypeError):
         return "N/A"
 
 
+@lru_cache(maxsize=64)
+def _format_uptime_minutes(total_minutes):
+    """Formats whole minutes; calls within the same minute share one string."""
+    days, minutes = divmod(total_minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{days}d {hours}h {minutes}m"
+
+
+@lru_cache(maxsize=128)
+def _parse_version(version):
+    """Parses a version string like 'v6.1.2' into a comparable Version (cached)."""
+    return Version(version)
+
+
+@lru_cache(maxsize=256)
 def compare_versions(version1, version2):
-    """Compares two version strings numerically."""
+    """Compares two version strings, returning -1, 0 or 1 (cached per pair).
+
+    Pre-releases such as 'v6.2-rc1' order before their release; strings that
+    are not versions at all (e.g. 'N/A') compare as equal.
+    """
     try:
-        v1_clean = version1.lstrip("vV")
-        v2_clean = version2.lstrip("vV")
-        v1_parts = [int(part) for part in v1_clean.split(".")]
-        v2_parts = [int(part) for part in v2_clean.split(".")]
-    except (ValueError, AttributeError):
+        v1 = _parse_version(version1)
+        v2 = _parse_version(version2)
+    except (InvalidVersion, TypeError):
         return 0
-    max_len = max(len(v1_parts), len(v2_parts))
-    v1_parts.extend([0] * (max_len - len(v1_parts)))
-    v2_parts.extend([0] * (max_len - len(v2_parts)))
-    for i in range(max_len):
-        if v1_parts[i] > v2_parts[i]:
-            return 1
-        if v1_parts[i] < v2_parts[i]:
-            return -1
-    return 0
+    return (v1 > v2) - (v1 < v2)
+
+
+# Pre-built bar segments; bars are sliced from these instead of multiplied
+_BAR_MAX_WIDTH = 100
+_BAR_FILLED = "■" * _BAR_MAX_WIDTH
+_BAR_EMPTY = "□" * _BAR_MAX_WIDTH
 
 
 def generate_ascii_bar(percent: float, total_width: int = 50) -> str:
     """Generates a colored ASCII progress bar string for Rich."""
-    filled_count = int(total_width * (percent / 100))
+    total_width = min(total_width, _BAR_MAX_WIDTH)
+    # Keep out-of-range percentages inside the bar
+    filled_count = min(max(int(total_width * (percent / 100)), 0), total_width)
+    return _ascii_bar(filled_count, total_width)
+
+
+@lru_cache(maxsize=256)
+def _ascii_bar(filled_count: int, total_width: int) -> str:
+    """Builds the bar markup; the key space is bounded by the bar width."""
     empty_count = total_width - filled_count
 
-    filled_part = "■" * filled_count
-    empty_part = "□" * empty_count  # Using space for empty part
+    filled_part = _BAR_FILLED[:filled_count]
+    empty_part = _BAR_EMPTY[:empty_count]
 
     # Use Rich markup for background colors
     bar_filled = f"[bold red]{filled_part}[/bold red]"
@@ -110,6 +178,12 @@ def generate_ascii_bar(percent: float, total_width: int = 50) -> str:
     return f"{bar_filled}{bar_empty}"
 
 
+# Heatmap color for each whole percentage 0..100
+_HEATMAP_COLORS = tuple(
+    "lime" if load < 75 else "yellow" if load < 90 else "red" for load in range(101)
+)
+
+
 def heatmap_generator(value1, value2=None):
     """
     Generates a heatmap color string based on a percentage.
@@ -126,7 +200,6 @@ def heatmap_generator(value1, value2=None):
         str: A string representing the color ('green', 'yellow', or 'red').
              Returns an error string if division by zero occurs.
     """
-    load = 0
     if value2 is None:
         # If one number is provided, use it as the percentage
         load = round(value1)
@@ -136,27 +209,32 @@ def heatmap_generator(value1, value2=None):
             return "Error: Division by zero"
         load = round((value1 / value2) * 100)
 
-    # Color logic based on the percentage
-    if load < 75:
-        return "lime"
-    elif load < 90:
-        return "yellow"
-    else:
-        return "red"
+    # Clamp into the lookup table; <0 is lime and >100 is red either way
+    return _HEATMAP_COLORS[min(max(load, 0), 100)]
 
 
-def generate_qrascii(pihole_url: str):
-    # Create a QR code object
+@lru_cache(maxsize=4)
+def build_qr_code(pihole_url: str):
+    """
+    Encodes a URL into a QR code once and caches it.
+
+    The TUI modal and the e-ink QR screen both render from this one object,
+    so the Reed-Solomon encoding and mask selection run once per URL.
+    """
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_L,
         box_size=1,  # Smaller box size for console output
         border=4,
     )
-
-    # Add data to the QR code
     qr.add_data(pihole_url)
     qr.make(fit=True)
+    return qr
+
+
+@lru_cache(maxsize=4)
+def generate_qrascii(pihole_url: str):
+    qr = build_qr_code(pihole_url)
     f = io.StringIO()
     qr.print_ascii(out=f)
     f.seek(0)